@@ -0,0 +1,24 @@
+"""Optional native build for the subtitle parser and the page JSON scanner.
+
+Packaging metadata lives in ``pyproject.toml``. When Cython is importable at build
+time (``pip install cython && python setup.py build_ext --inplace``), the pure-Python
+``ebook_pipeline.vtt`` module is compiled to an extension that shadows the ``.py``
+file, and ``ebook_pipeline._native`` (the brace scanner used by ``youtube.py``) is
+built from its ``.pyx``; otherwise the package installs as plain Python. After editing
+either source, rerun ``build_ext --inplace`` or delete the built ``.so``/``.pyd`` files
+to go back to the pure-Python code.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        ["src/ebook_pipeline/vtt.py", "src/ebook_pipeline/_native.pyx"],
+        language_level=3,
+    )
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,40 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional compiled helpers for ``ebook_pipeline.youtube``.
+
+Built by ``setup.py`` when Cython is available; ``youtube.py`` falls back to its
+pure-Python scan with identical results when this extension is missing.
+"""
+
+
+def scan_balanced(str source, Py_ssize_t start):
+    """Return the index just past the brace that balances ``source[start]``, or -1.
+
+    JSON string literals are skipped whole, like ``youtube._JSON_SCAN_RE``: an
+    unterminated quote counts as a plain character and scanning resumes after it.
+    """
+    cdef Py_ssize_t n = len(source)
+    cdef Py_ssize_t i = start
+    cdef Py_ssize_t depth = 0
+    cdef Py_ssize_t quote = -1
+    cdef Py_UCS4 c
+    while i < n:
+        c = source[i]
+        if quote != -1:
+            if c == u'\\':
+                i += 1
+            elif c == u'"':
+                quote = -1
+        elif c == u'"':
+            quote = i
+        elif c == u'{':
+            depth += 1
+        elif c == u'}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+        if i >= n and quote != -1:
+            # Braces cannot occur inside a literal, so depth is as it was at the quote.
+            i = quote + 1
+            quote = -1
+    return -1
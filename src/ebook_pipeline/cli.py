@@ -6,24 +6,25 @@ import argparse
 import json
 from datetime import date
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from . import PROJECT_ROOT
 from .build import build_book
 from .config import (
     CONFIG_PATH,
     Config,
+    dump_config,
     load_config,
     load_or_create_config,
     resolve_config_path,
-    write_config,
 )
 from .doctor import doctor
 from .enrich import enrich_talks
 from .ingest import ingest_file
-from .paths import SeriesPaths
+from .paths import SeriesPaths, rel_to_root
 from .polish import polish_series
 from .subtitles import download_subtitles
+from .utils import write_file
 from .youtube import PlaylistDiscoveryError, fetch_and_store
 
 
@@ -69,68 +70,61 @@ def cmd_init(_cfg: Optional[Config], args: argparse.Namespace) -> None:
     else:
         series_list.append(entry)
     raw["series"] = sorted(series_list, key=lambda item: item.get("slug", ""))
-    cfg_path = write_config(raw, cfg_path)
+    cfg_path.parent.mkdir(parents=True, exist_ok=True)
+    writes: List[Tuple[Path, bytes]] = [(cfg_path, dump_config(raw))]
 
     paths = SeriesPaths(slug=args.series, metadata_file=metadata_rel)
     paths.ensure()
 
+    title = entry["title"].encode("utf-8")
+    slug = args.series.encode("utf-8")
+
     metadata_path = paths.metadata_path
     if metadata_path and (args.force or not metadata_path.exists()):
         today = date.today()
-        metadata_path.write_text(
-            "\n".join(
-                [
-                    f"title: {entry['title']}",
-                    "subtitle: Talks compiled into an eBook",
-                    f"author: {entry['title']} Speakers",
-                    "language: en",
-                    f"copyright: © {today.year}",
-                    f"date: {today.isoformat()}",
-                ]
-            )
-            + "\n",
-            encoding="utf-8",
+        metadata = b"\n".join(
+            [
+                b"title: " + title,
+                b"subtitle: Talks compiled into an eBook",
+                b"author: " + title + b" Speakers",
+                b"language: en",
+                f"copyright: © {today.year}".encode("utf-8"),
+                f"date: {today.isoformat()}".encode("utf-8"),
+            ]
         )
+        writes.append((metadata_path, metadata + b"\n"))
 
     if args.with_intro:
         intro_path = paths.content_dir / "000-introduction.md"
         if args.force or not intro_path.exists():
-            intro = "\n".join(
+            intro = b"\n".join(
                 [
-                    "# Introduction",
-                    "",
-                    f"{entry['title']} — generated with the eBook pipeline.",
-                    "",
-                    "Update the content by running:",
-                    "",
-                    f"- `my-ebook fetch --series {args.series}`",
-                    f"- `my-ebook ingest --series {args.series}`",
-                    f"- `my-ebook polish --series {args.series}`",
-                    f"- `my-ebook build --series {args.series}`",
-                    "",
-                    "Add or edit chapters in the content folder; rerun build to refresh the manuscript.",
+                    b"# Introduction",
+                    b"",
+                    title + " — generated with the eBook pipeline.".encode("utf-8"),
+                    b"",
+                    b"Update the content by running:",
+                    b"",
+                    b"- `my-ebook fetch --series " + slug + b"`",
+                    b"- `my-ebook ingest --series " + slug + b"`",
+                    b"- `my-ebook polish --series " + slug + b"`",
+                    b"- `my-ebook build --series " + slug + b"`",
+                    b"",
+                    b"Add or edit chapters in the content folder; rerun build to refresh the manuscript.",
                 ]
             )
-            intro_path.write_text(intro + "\n", encoding="utf-8")
+            writes.append((intro_path, intro + b"\n"))
+
+    # One raw write per file instead of a buffered text-mode round trip each.
+    for target, data in writes:
+        write_file(target, data)
 
-    try:
-        rel_cfg = cfg_path.relative_to(PROJECT_ROOT)
-    except ValueError:
-        rel_cfg = cfg_path
     print(f"Initialized series '{args.series}'")
-    print(f"- Config: {rel_cfg}")
+    print(f"- Config: {rel_to_root(cfg_path)}")
     if metadata_path:
-        try:
-            rel_meta = metadata_path.relative_to(PROJECT_ROOT)
-        except ValueError:
-            rel_meta = metadata_path
-        print(f"- Metadata: {rel_meta}")
+        print(f"- Metadata: {rel_to_root(metadata_path)}")
     for label, p in (("Data dir", paths.data_dir), ("Content dir", paths.content_dir), ("Build dir", paths.build_dir)):
-        try:
-            rel = p.relative_to(PROJECT_ROOT)
-        except ValueError:
-            rel = p
-        print(f"- {label}: {rel}")
+        print(f"- {label}: {rel_to_root(p)}")
 
 
 def cmd_list(cfg: Optional[Config], _args: argparse.Namespace) -> None:
@@ -139,9 +133,9 @@ def cmd_list(cfg: Optional[Config], _args: argparse.Namespace) -> None:
     for series in cfg.list_series():
         paths = series.to_paths()
         print(f"- {series.slug}: {series.title}")
-        print(f"    data: {paths.data_dir.relative_to(PROJECT_ROOT)}")
-        print(f"    content: {paths.content_dir.relative_to(PROJECT_ROOT)}")
-        print(f"    build: {paths.build_dir.relative_to(PROJECT_ROOT)}")
+        print(f"    data: {rel_to_root(paths.data_dir)}")
+        print(f"    content: {rel_to_root(paths.content_dir)}")
+        print(f"    build: {rel_to_root(paths.build_dir)}")
 
 
 def cmd_doctor(cfg: Optional[Config], args: argparse.Namespace) -> None:
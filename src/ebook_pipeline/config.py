@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import json
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
 from . import PROJECT_ROOT
 from .paths import SeriesPaths
+from .utils import write_file
 
 
 CONFIG_PATH = PROJECT_ROOT / "config" / "series.json"
 
+# ``slots=`` needs Python 3.10+; older interpreters get a regular frozen dataclass.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 def resolve_config_path(path: Optional[str | Path]) -> Path:
     """Normalize a user-supplied config path against the working root."""
@@ -25,7 +30,7 @@ def resolve_config_path(path: Optional[str | Path]) -> Path:
     return candidate
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class SeriesConfig:
     slug: str
     title: str
@@ -65,13 +70,11 @@ def load_config(path: Optional[Path | str] = None) -> Config:
     cfg_path = resolve_config_path(path)
     if not cfg_path.exists():
         raise FileNotFoundError(f"Missing config file: {cfg_path}")
-    with open(cfg_path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+    raw = json.loads(cfg_path.read_bytes())
     series_raw = raw.get("series")
     if not isinstance(series_raw, list) or not series_raw:
         raise ValueError("No series defined in config.")
-    series = [SeriesConfig.from_dict(item) for item in series_raw]
-    return Config(series)
+    return Config(SeriesConfig.from_dict(item) for item in series_raw)
 
 
 def load_or_create_config(cfg_path: Path) -> Dict[str, Any]:
@@ -79,8 +82,7 @@ def load_or_create_config(cfg_path: Path) -> Dict[str, Any]:
 
     if not cfg_path.exists():
         return {"series": []}
-    with cfg_path.open("r", encoding="utf-8") as fh:
-        raw = json.load(fh)
+    raw = json.loads(cfg_path.read_bytes())
     if not isinstance(raw, dict):
         raise ValueError("Invalid config format: expected a JSON object.")
     if "series" not in raw or not isinstance(raw["series"], list):
@@ -88,13 +90,18 @@ def load_or_create_config(cfg_path: Path) -> Dict[str, Any]:
     return raw
 
 
+def dump_config(config: Dict[str, Any]) -> bytes:
+    """Serialize config JSON with stable formatting."""
+
+    return json.dumps(config, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def write_config(config: Dict[str, Any], path: Optional[Path | str] = None) -> Path:
     """Persist config JSON with stable formatting."""
 
     cfg_path = resolve_config_path(path)
     cfg_path.parent.mkdir(parents=True, exist_ok=True)
-    with cfg_path.open("w", encoding="utf-8") as fh:
-        json.dump(config, fh, ensure_ascii=False, indent=2)
+    write_file(cfg_path, dump_config(config))
     return cfg_path
 
 
@@ -102,6 +109,7 @@ __all__ = [
     "Config",
     "SeriesConfig",
     "CONFIG_PATH",
+    "dump_config",
     "load_config",
     "load_or_create_config",
     "resolve_config_path",
@@ -5,21 +5,13 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional, Sequence
 
-from . import PROJECT_ROOT
 from .config import Config, load_config, resolve_config_path
-from .paths import SeriesPaths
+from .paths import SeriesPaths, rel_to_root
 from .utils import find_yt_dlp
 
 __all__ = ["doctor"]
 
 
-def _rel(path: Path) -> Path:
-    try:
-        return path.relative_to(PROJECT_ROOT)
-    except ValueError:
-        return path
-
-
 def _series_list(cfg: Config, series_slug: Optional[str]) -> Sequence:
     if series_slug:
         return [cfg.get(series_slug)]
@@ -37,7 +29,7 @@ def doctor(cfg: Optional[Config], *, config_path: Path, series_slug: Optional[st
 
     issues = 0
     cfg_path = resolve_config_path(config_path)
-    print(f"Config: {_rel(cfg_path)}")
+    print(f"Config: {rel_to_root(cfg_path)}")
     if not cfg_path.exists():
         print("  Missing config. Run `my-ebook init --series <slug> --with-intro` to get started.")
         return 1
@@ -51,7 +43,7 @@ def doctor(cfg: Optional[Config], *, config_path: Path, series_slug: Optional[st
 
     ytdlp = find_yt_dlp()
     if ytdlp:
-        print(f"yt-dlp: {_rel(ytdlp)}")
+        print(f"yt-dlp: {rel_to_root(ytdlp)}")
     else:
         issues += 1
         print("yt-dlp: not found. Install with `python3 -m pip install yt-dlp` or set YTDLP=/path/to/yt-dlp")
@@ -71,54 +63,54 @@ def doctor(cfg: Optional[Config], *, config_path: Path, series_slug: Optional[st
 
         if not paths.data_dir.exists():
             issues += 1
-            print(f"  data dir: missing ({_rel(paths.data_dir)}) — run `my-ebook init --series {series.slug}`")
+            print(f"  data dir: missing ({rel_to_root(paths.data_dir)}) — run `my-ebook init --series {series.slug}`")
         else:
-            print(f"  data dir: {_rel(paths.data_dir)}")
+            print(f"  data dir: {rel_to_root(paths.data_dir)}")
 
         videos_exists = paths.videos_path.exists()
         talks_exists = paths.talks_path.exists()
         if videos_exists:
-            print(f"  videos.json: {_rel(paths.videos_path)}")
+            print(f"  videos.json: {rel_to_root(paths.videos_path)}")
         else:
             issues += 1
-            print(f"  videos.json: missing ({_rel(paths.videos_path)}) — run `my-ebook fetch --series {series.slug}`")
+            print(f"  videos.json: missing ({rel_to_root(paths.videos_path)}) — run `my-ebook fetch --series {series.slug}`")
 
         if talks_exists:
-            print(f"  talks.json: {_rel(paths.talks_path)}")
+            print(f"  talks.json: {rel_to_root(paths.talks_path)}")
         else:
             issues += 1
-            print(f"  talks.json: missing ({_rel(paths.talks_path)}) — run `my-ebook update --series {series.slug}`")
+            print(f"  talks.json: missing ({rel_to_root(paths.talks_path)}) — run `my-ebook update --series {series.slug}`")
 
         if paths.content_dir.exists():
             chapters = _count_markdown(paths)
             if chapters:
-                print(f"  chapters: {chapters} Markdown file(s) in {_rel(paths.content_dir)}")
+                print(f"  chapters: {chapters} Markdown file(s) in {rel_to_root(paths.content_dir)}")
             else:
                 issues += 1
                 print(
-                    f"  chapters: none found in {_rel(paths.content_dir)} — ingest talks with "
+                    f"  chapters: none found in {rel_to_root(paths.content_dir)} — ingest talks with "
                     f"`my-ebook ingest --series {series.slug}`"
                 )
         else:
             issues += 1
-            print(f"  content dir: missing ({_rel(paths.content_dir)}) — run `my-ebook init --series {series.slug}`")
+            print(f"  content dir: missing ({rel_to_root(paths.content_dir)}) — run `my-ebook init --series {series.slug}`")
 
         if paths.metadata_path:
             if paths.metadata_path.exists():
-                print(f"  metadata: {_rel(paths.metadata_path)}")
+                print(f"  metadata: {rel_to_root(paths.metadata_path)}")
             else:
                 issues += 1
-                print(f"  metadata: missing ({_rel(paths.metadata_path)}) — edit or recreate your YAML metadata file")
+                print(f"  metadata: missing ({rel_to_root(paths.metadata_path)}) — edit or recreate your YAML metadata file")
         elif verbose:
             print("  metadata: not configured; defaults will be used")
 
         if paths.build_dir.exists():
             book = paths.book_path
             if book.exists():
-                print(f"  book.md: present at {_rel(book)}")
+                print(f"  book.md: present at {rel_to_root(book)}")
             else:
                 print(f"  book.md: not built yet — run `my-ebook build --series {series.slug}`")
         elif verbose:
-            print(f"  build dir: {_rel(paths.build_dir)} (will be created on build)")
+            print(f"  build dir: {rel_to_root(paths.build_dir)} (will be created on build)")
 
     return issues
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
+import os
 import re
 import subprocess
 from datetime import datetime
@@ -10,16 +12,57 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from .paths import SeriesPaths
-from .utils import find_yt_dlp
+from .utils import dump_json, find_yt_dlp, write_file_atomic
+
+_PARA_SPLIT_RE = re.compile(r"\n\s*\n", re.S)
+_BRACKET_NOISE_RE = re.compile(r"\[(music|applause|laughter|inaudible)[^\]]*\]", re.I)
+_PAREN_NOISE_RE = re.compile(r"\((music|applause|laughter|inaudible)[^\)]*\)", re.I)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([,.;:!?])")
+_PUNCT_NO_SPACE_RE = re.compile(r"([,.;:!?])(?!\s|$)")
+_JSON_TOKEN_RE = re.compile(r'[{}"\\]')
+
+# Below this much transcript text, process start-up costs more than it saves.
+PARALLEL_MIN_CHARS = 200_000
+
+
+def _json_object_span(txt: str) -> str:
+    """Slice ``txt`` from its first ``{`` to the last point where braces balance, in one pass."""
+
+    start = txt.find("{")
+    if start == -1:
+        return txt
+    depth = 0
+    end = -1
+    in_str = False
+    pos = start
+    while True:
+        m = _JSON_TOKEN_RE.search(txt, pos)
+        if m is None:
+            break
+        c = m.group()
+        pos = m.end()
+        if in_str:
+            if c == "\\":
+                pos += 1
+            elif c == '"':
+                in_str = False
+        elif c == '"':
+            in_str = True
+        elif c == "{":
+            depth += 1
+        elif c == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                end = pos
+    return txt if end == -1 else txt[start:end]
 
 
 def run_json(cmd: List[str]) -> Optional[Dict[str, Any]]:
     try:
         out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
         txt = out.decode("utf-8", errors="replace")
-        match = re.search(r"\{.*\}\s*$", txt, flags=re.S)
-        data = txt if match is None else match.group(0)
-        return json.loads(data)
+        return json.loads(_json_object_span(txt))
     except Exception:
         return None
 
@@ -35,22 +78,32 @@ def normalize_date(yyyymmdd: str) -> Optional[str]:
 
 
 def clean_text(text: str) -> str:
-    paras = re.split(r"\n\s*\n", text.strip(), flags=re.S)
+    paras = _PARA_SPLIT_RE.split(text.strip())
     cleaned: List[str] = []
     for p in paras:
-        p = re.sub(r"\[(music|applause|laughter|inaudible)[^\]]*\]", "", p, flags=re.I)
-        p = re.sub(r"\((music|applause|laughter|inaudible)[^\)]*\)", "", p, flags=re.I)
-        p = re.sub(r"<[^>]+>", "", p)
-        p = re.sub(r"\s+", " ", p)
-        p = re.sub(r"\s+([,.;:!?])", r"\1", p)
-        p = re.sub(r"([,.;:!?])(?!\s|$)", r"\1 ", p)
-        p = re.sub(r"\s{2,}", " ", p)
+        p = _BRACKET_NOISE_RE.sub("", p)
+        p = _PAREN_NOISE_RE.sub("", p)
+        p = _TAG_RE.sub("", p)
+        # str.split() collapses whitespace runs and trims the ends in C.
+        p = " ".join(p.split())
+        p = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", p)
+        p = _PUNCT_NO_SPACE_RE.sub(r"\1 ", p)
         p = p.strip()
         if p:
             cleaned.append(p)
     return "\n\n".join(cleaned) + "\n"
 
 
+def clean_many(texts: List[str]) -> List[str]:
+    """Run ``clean_text`` over many transcripts, fanning out to processes for large inputs."""
+
+    workers = os.cpu_count() or 1
+    if workers < 2 or len(texts) < 2 or sum(map(len, texts)) < PARALLEL_MIN_CHARS:
+        return [clean_text(txt) for txt in texts]
+    with multiprocessing.Pool(min(workers, len(texts))) as pool:
+        return pool.map(clean_text, texts, chunksize=4)
+
+
 def enrich_with_ytdlp(url: str, ytdlp: Path, cookies: Optional[Path] = None, browser: str = "") -> Dict[str, Any]:
     meta: Dict[str, Any] = {}
     if not ytdlp:
@@ -90,7 +143,7 @@ def enrich_talks(
     if not src_path.exists():
         raise FileNotFoundError(f"Missing talks file: {src_path}")
 
-    talks_data = json.loads(src_path.read_text(encoding="utf-8"))
+    talks_data = json.loads(src_path.read_bytes())
     talks: List[Dict[str, Any]] = talks_data.get("talks") or []
 
     if use_yt_dlp:
@@ -98,11 +151,12 @@ def enrich_talks(
     else:
         ytdlp = None
 
+    texts = [(t.get("transcript") or "").rstrip() for t in talks]
+    cleaned = clean_many(texts)
+
     changed = 0
-    for t in talks:
+    for t, txt, new_txt in zip(talks, texts, cleaned):
         src = (t.get("source_url") or "").strip()
-        txt = (t.get("transcript") or "").rstrip()
-        new_txt = clean_text(txt)
         if new_txt != txt + "\n":
             t["transcript"] = new_txt
             changed += 1
@@ -116,8 +170,8 @@ def enrich_talks(
                 changed += 1
 
     if changed:
-        out_path.write_text(json.dumps(talks_data, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_file_atomic(out_path, dump_json(talks_data))
     return changed
 
 
-__all__ = ["clean_text", "enrich_talks", "find_yt_dlp"]
+__all__ = ["clean_many", "clean_text", "enrich_talks", "find_yt_dlp"]
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
-import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Sequence
 
 from .paths import SeriesPaths
+from .utils import load_json
 
+_SLUG_KEEP = re.compile(r"[^a-z0-9\s-]")
+_SLUG_DASH = re.compile(r"[\s_-]+")
 
+
+@lru_cache(maxsize=512)
 def slugify(text: str, max_len: int = 80) -> str:
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9\s-]", "", text)
-    text = re.sub(r"[\s_-]+", "-", text).strip("-")
+    text = _SLUG_KEEP.sub("", text.lower())
+    text = _SLUG_DASH.sub("-", text).strip("-")
     if len(text) > max_len:
         text = text[:max_len].rstrip("-")
     return text
@@ -26,14 +30,16 @@ def format_chapter_md(entry: Dict[str, Any]) -> str:
     source_url = (entry.get("source_url") or "").strip()
     transcript = (entry.get("transcript") or "").rstrip() + "\n"
 
-    header = f"# {speaker}: {title}\n\n"
-    meta_lines: List[str] = []
+    parts = [f"# {speaker}: {title}\n\n"]
     if date:
-        meta_lines.append(f"- Date: {date}")
+        parts.append(f"- Date: {date}\n")
     if source_url:
-        meta_lines.append(f"- Source: {source_url}")
-    meta = ("\n".join(meta_lines) + "\n\n") if meta_lines else ""
-    return header + meta + transcript + "\n"
+        parts.append(f"- Source: {source_url}\n")
+    if date or source_url:
+        parts.append("\n")
+    parts.append(transcript)
+    parts.append("\n")
+    return "".join(parts)
 
 
 def write_chapter(path: Path, content: str) -> None:
@@ -55,20 +61,22 @@ def ingest_talks(
 
     paths.ensure()
     written: List[Path] = []
+    content_dir = paths.content_dir
+    rel_base = content_dir.parent
     idx = start_index
     for entry in talks:
         speaker = (entry.get("speaker") or "Unknown Speaker").strip()
         title = (entry.get("title") or "Untitled Talk").strip()
         slug = slugify(f"{speaker}-{title}") or f"chapter-{idx:02d}"
-        chapter_path = paths.content_dir / f"{idx:02d}-{slug}.md"
+        chapter_path = content_dir / f"{idx:02d}-{slug}.md"
 
         if chapter_path.exists() and not overwrite:
-            print(f"Skip existing: {chapter_path.relative_to(paths.content_dir.parent)}")
+            print(f"Skip existing: {chapter_path.relative_to(rel_base)}")
         else:
             md = format_chapter_md(entry)
             write_chapter(chapter_path, md)
             written.append(chapter_path)
-            print(f"Wrote: {chapter_path.relative_to(paths.content_dir.parent)}")
+            print(f"Wrote: {chapter_path.relative_to(rel_base)}")
         idx += 1
     if not written:
         print("No chapters written (all existed). Use overwrite=True to replace.")
@@ -86,8 +94,7 @@ def ingest_file(
 ) -> List[Path]:
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
-    with input_path.open("r", encoding="utf-8") as fh:
-        data: Dict[str, Any] = json.load(fh)
+    data: Dict[str, Any] = load_json(input_path.read_bytes())
     talks = data.get("talks")
     if not isinstance(talks, list) or not talks:
         raise ValueError("No talks found in input JSON (expected key 'talks').")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -38,6 +39,10 @@ class SeriesPaths:
     def talks_path(self) -> Path:
         return self.data_dir / "talks.json"
 
+    @property
+    def cache_dir(self) -> Path:
+        return self.data_dir / "cache"
+
     @property
     def content_dir(self) -> Path:
         return self._resolve_under(self.content_root)
@@ -68,4 +73,18 @@ class SeriesPaths:
             path.mkdir(parents=True, exist_ok=True)
 
 
-__all__ = ["SeriesPaths"]
+@lru_cache(maxsize=256)
+def _rel_to_root(path: str) -> Path:
+    try:
+        return Path(path).relative_to(PROJECT_ROOT)
+    except ValueError:
+        return Path(path)
+
+
+def rel_to_root(path: Path) -> Path:
+    """Return ``path`` relative to the project root when it lives under it."""
+
+    return _rel_to_root(str(path))
+
+
+__all__ = ["SeriesPaths", "rel_to_root"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
 
@@ -27,37 +28,51 @@ CONTRACTIONS = [
     (r"\bi'd\b", "I'd"),
 ]
 
+FILLER_RE = re.compile("|".join(f"(?:{p})" for p in FILLER_PATTERNS), re.IGNORECASE)
+WS2_RE = re.compile(r"\s{2,}")
+WS_PUNCT_RE = re.compile(r"\s+([,.;:!?])")
+WS_ANY_RE = re.compile(r"\s+")
+# One pass for pronoun, contraction and acronym casing. Contractions come before the
+# bare pronoun so it cannot claim their leading "i"; each rule is its own group and
+# ``lastindex`` picks the replacement.
+FIXUP_RULES = [*CONTRACTIONS, (r"(?-i:\bi\b)", "I"), *LOWER_TO_UPPER_TERMS]
+FIXUP_RE = re.compile("|".join(f"({p})" for p, _ in FIXUP_RULES), re.IGNORECASE)
+FIXUP_REPL = [repl for _, repl in FIXUP_RULES]
+SENTENCE_SPLIT_RE = re.compile(r"([.!?]+)\s+")
+# Letters plus non-decimal numerics ("½", "Ⅵ"); callers confirm the match with str.isalpha.
+FIRST_ALPHA_RE = re.compile(r"[^\W\d_]")
+
+
+def _fixup(match: re.Match) -> str:
+    return FIXUP_REPL[match.lastindex - 1]
+
 
 def remove_filler(text: str) -> str:
-    out = text
-    for pat in FILLER_PATTERNS:
-        out = re.sub(pat, "", out, flags=re.IGNORECASE)
-    out = re.sub(r"\s{2,}", " ", out)
-    out = re.sub(r"\s+([,.;:!?])", r"\1", out)
+    out = FILLER_RE.sub("", text)
+    out = WS2_RE.sub(" ", out)
+    out = WS_PUNCT_RE.sub(r"\1", out)
     return out.strip()
 
 
 def sentence_case_paragraph(paragraph: str) -> str:
-    paragraph = re.sub(r"\s+", " ", paragraph).strip()
+    paragraph = WS_ANY_RE.sub(" ", paragraph).strip()
     if not paragraph:
         return paragraph
-    parts = re.split(r"([.!?]+)\s+", paragraph)
+    parts = SENTENCE_SPLIT_RE.split(paragraph)
     rebuilt: List[str] = []
     idx = 0
     while idx < len(parts):
         seg = parts[idx]
         sep = parts[idx + 1] if idx + 1 < len(parts) else ""
-        seg_chars = list(seg)
-        for pos, ch in enumerate(seg_chars):
-            if ch.isalpha():
-                seg_chars[pos] = ch.upper()
-                break
-        seg_fixed = "".join(seg_chars)
-        seg_fixed = re.sub(r"\bi\b", "I", seg_fixed)
-        for pat, repl in CONTRACTIONS:
-            seg_fixed = re.sub(pat, repl, seg_fixed, flags=re.IGNORECASE)
-        for pat, repl in LOWER_TO_UPPER_TERMS:
-            seg_fixed = re.sub(pat, repl, seg_fixed, flags=re.IGNORECASE)
+        m = FIRST_ALPHA_RE.search(seg)
+        while m and not m.group().isalpha():
+            m = FIRST_ALPHA_RE.search(seg, m.end())
+        if m:
+            pos = m.start()
+            seg_fixed = seg[:pos] + seg[pos].upper() + seg[pos + 1:]
+        else:
+            seg_fixed = seg
+        seg_fixed = FIXUP_RE.sub(_fixup, seg_fixed)
         rebuilt.append(seg_fixed)
         if sep:
             rebuilt.append(sep + " ")
@@ -76,35 +91,24 @@ def add_subheadings(paragraphs: List[str]) -> List[str]:
         "## Conclusion",
     ]
     sections = min(len(headings), max(2, min(5, len(paragraphs) // 6)))
-    heads = headings[:sections]
-    result: List[str] = []
     total = len(paragraphs)
-    for idx, heading in enumerate(heads):
-        start = (total * idx) // sections
-        end = (total * (idx + 1)) // sections
-        if idx == 0:
-            result.append(heading)
-        else:
+    bounds = [total * i // sections for i in range(sections + 1)]
+    result: List[str] = []
+    for i in range(sections):
+        result.append(headings[i])
+        result.extend(paragraphs[bounds[i]:bounds[i + 1]])
+        if i < sections - 1:
             result.append("")
-            result.append(heading)
-        result.extend(paragraphs[start:end])
     return result
 
 
 def split_header_body(content: str) -> Tuple[List[str], List[str]]:
-    lines = content.splitlines()
-    header_lines: List[str] = []
-    idx = 0
-    while idx < len(lines):
-        header_lines.append(lines[idx])
-        if idx >= 1 and not lines[idx].strip():
-            break
-        if idx >= 1 and not lines[idx].startswith("-") and not lines[idx].startswith("#"):
-            header_lines.append("")
-            break
-        idx += 1
-    body = content.split("\n", len(header_lines))[-1]
-    body = body.strip("\n")
+    # Chapters from ``format_chapter_md`` always end the title block with a blank line.
+    idx = content.find("\n\n")
+    if idx < 0:
+        return content.splitlines(), []
+    header_lines = content[:idx].split("\n")
+    body = content[idx + 2:].strip("\n")
     return header_lines, body.split("\n\n") if body else []
 
 
@@ -132,9 +136,15 @@ def polish_series(paths: SeriesPaths, file: Optional[Path] = None) -> List[Path]
         targets = [file if file.is_absolute() else paths.content_dir / file]
     else:
         targets = list(iter_chapters(paths))
+    if len(targets) > 1:
+        # Chapters are independent CPU-bound regex work, so spread them across cores.
+        with ProcessPoolExecutor() as pool:
+            list(pool.map(polish_file, targets))
+    else:
+        for path in targets:
+            polish_file(path)
     updated: List[Path] = []
     for path in targets:
-        polish_file(path)
         updated.append(path)
         print(f"Polished: {path}")
     return updated
@@ -2,27 +2,33 @@
 
 from __future__ import annotations
 
-import json
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from . import PROJECT_ROOT
 from .paths import SeriesPaths
-from .utils import find_yt_dlp
+from .utils import dump_json, find_yt_dlp, http_client, load_json, new_http_client, write_file_atomic
+from .vtt import parse_vtt_to_paragraphs
 from .youtube import (
     get_yt_initial_player_response,
     split_title_and_speaker,
     xml_to_paragraphs,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
 UA = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/124.0 Safari/537.36"
 )
 
+MAX_DOWNLOAD_WORKERS = 8
+
 
 def run(cmd: List[str]) -> int:
     print("$", " ".join(cmd))
@@ -55,61 +61,6 @@ def find_vtt_for_video(subs_dir: Path, video_id: str) -> Optional[Path]:
     return candidates[0] if candidates else None
 
 
-def parse_vtt_to_paragraphs(path: Path) -> str:
-    lines = [ln.rstrip("\n") for ln in path.read_text(encoding="utf-8", errors="replace").splitlines()]
-    text_lines: List[str] = []
-    for ln in lines:
-        if not ln:
-            text_lines.append("")
-            continue
-        if ln.startswith("WEBVTT") or ln.startswith("NOTE"):
-            continue
-        if re.match(r"^\d{2}:\d{2}:\d{2}\.\d{3} --> ", ln):
-            continue
-        if re.match(r"^\d+$", ln):
-            continue
-        if re.match(r"^(Kind|Language|Style|Region):", ln, flags=re.IGNORECASE):
-            continue
-        if "<c>" in ln or re.search(r"<\d{2}:\d{2}:\d{2}\.\d{3}>", ln):
-            continue
-        clean = re.sub(r"<[^>]+>", "", ln)
-        clean = re.sub(r"\[(music|applause|laughter|inaudible)[^\]]*\]", "", clean, flags=re.IGNORECASE)
-        trimmed = clean.strip()
-        if text_lines and trimmed and text_lines[-1] == trimmed:
-            continue
-        text_lines.append(trimmed)
-
-    paras: List[str] = []
-    buf: List[str] = []
-    seen_in_para: set[str] = set()
-    for ln in text_lines:
-        if not ln.strip():
-            continue
-        frag = ln.strip()
-        if buf and frag:
-            last = buf[-1]
-            if last == frag:
-                continue
-            if frag.startswith(last) and len(frag) > len(last) + 2:
-                buf[-1] = frag
-                continue
-            if last.startswith(frag) and len(last) > len(frag) + 2:
-                continue
-        if frag and frag in seen_in_para:
-            continue
-        buf.append(frag)
-        if frag:
-            seen_in_para.add(frag)
-        if len(" ".join(buf)) > 800:
-            paras.append(" ".join(buf))
-            buf = []
-            seen_in_para.clear()
-    if buf:
-        paras.append(" ".join(buf))
-    paras = [re.sub(r"\s+", " ", p).strip() for p in paras if p.strip()]
-    return "\n\n".join(paras) + "\n"
-
-
 def load_cookies_from_netscape(path: Path) -> Dict[str, str]:
     jar: Dict[str, str] = {}
     if not path.exists():
@@ -133,14 +84,27 @@ def cookie_header_from_jar(jar: Dict[str, str]) -> str:
     return "; ".join(f"{k}={v}" for k, v in jar.items())
 
 
-def http_get(url: str, cookies_path: Optional[Path] = None) -> Optional[str]:
+def http_get(
+    url: str,
+    cookies: Optional[Dict[str, str]] = None,
+    client: Optional["httpx.Client"] = None,
+) -> Optional[str]:
     from urllib.request import Request, urlopen
 
     headers = {"User-Agent": UA, "Accept-Language": "en-US,en;q=0.9"}
-    if cookies_path:
-        jar = load_cookies_from_netscape(cookies_path)
-        if jar:
-            headers["Cookie"] = cookie_header_from_jar(jar)
+    # Authenticated requests go through the caller's cookie client (see new_http_client):
+    # httpx drops a hand-set Cookie header on redirects, and the shared client must never
+    # see these cookies.
+    if client is None and not cookies:
+        client = http_client()
+    if client is not None:
+        try:
+            resp = client.get(url, headers=headers)
+        except Exception:
+            return None
+        return None if resp.is_error else resp.text
+    if cookies:
+        headers["Cookie"] = cookie_header_from_jar(cookies)
     try:
         req = Request(url, headers=headers)
         with urlopen(req, timeout=20) as resp:
@@ -154,9 +118,13 @@ def http_get(url: str, cookies_path: Optional[Path] = None) -> Optional[str]:
         return None
 
 
-def fetch_transcript_via_cookies(video_id: str, cookies_path: Path) -> Optional[str]:
+def fetch_transcript_via_cookies(
+    video_id: str,
+    cookies: Dict[str, str],
+    client: Optional["httpx.Client"] = None,
+) -> Optional[str]:
     watch_url = f"https://www.youtube.com/watch?v={video_id}&hl=en"
-    html = http_get(watch_url, cookies_path=cookies_path)
+    html = http_get(watch_url, cookies, client)
     if not html:
         return None
     pr = get_yt_initial_player_response(html)
@@ -188,7 +156,7 @@ def fetch_transcript_via_cookies(video_id: str, cookies_path: Path) -> Optional[
     if "fmt=" not in base:
         sep = "&" if "?" in base else "?"
         base = f"{base}{sep}fmt=srv1"
-    xml = http_get(base, cookies_path=cookies_path)
+    xml = http_get(base, cookies, client)
     if not xml:
         return None
     return xml_to_paragraphs(xml)
@@ -209,7 +177,7 @@ def download_subtitles(
         raise FileNotFoundError(
             f"Missing {videos_file}. Run fetch_yc_ai_startup_school.py --export-videos first."
         )
-    data = json.loads(videos_file.read_text(encoding="utf-8"))
+    data = load_json(videos_file.read_bytes())
     videos = data.get("videos") or []
     if limit and limit > 0:
         videos = videos[:limit]
@@ -221,64 +189,86 @@ def download_subtitles(
 
     talks: List[Dict[str, str]] = []
 
-    for idx, video in enumerate(videos, start=1):
+    ytdlp = find_yt_dlp()
+
+    def fetch_one(idx: int, video: Dict[str, str]) -> Tuple[Dict[str, str], int, Optional[Path]]:
         vid = video.get("video_id")
         title = video.get("title") or ""
-        url = video.get("url")
         print(f"[{idx}/{len(videos)}] {vid} — {title}")
-        ytdlp = find_yt_dlp()
         if not ytdlp:
             print("  yt-dlp not found. Install yt-dlp or set YTDLP to its path.")
-            rc = 1
-        else:
-            cmd = [
-                str(ytdlp),
-                "--skip-download",
-                "--write-auto-sub",
-                "--write-sub",
-                "--sub-lang",
-                "en,en-US,en-GB",
-                "--sub-format",
-                "vtt",
-                "--extractor-args",
-                "youtube:player_client=web,web_creator,ios|njsig",
-                "-o",
-                str(subs_dir / "%(id)s.%(ext)s"),
-                "--ignore-no-formats-error",
-            ]
-            if cookies:
-                cmd += ["--cookies", str(cookies)]
-            elif browser:
-                cmd += ["--cookies-from-browser", browser]
-            cmd.append(url)
-            rc = run(cmd)
-        transcript: Optional[str] = None
-        if rc == 0:
-            vtt = find_vtt_for_video(subs_dir, vid)
+            return video, 1, None
+        cmd = [
+            str(ytdlp),
+            "--skip-download",
+            "--write-auto-sub",
+            "--write-sub",
+            "--sub-lang",
+            "en,en-US,en-GB",
+            "--sub-format",
+            "vtt",
+            "--extractor-args",
+            "youtube:player_client=web,web_creator,ios|njsig",
+            "-o",
+            str(subs_dir / "%(id)s.%(ext)s"),
+            "--ignore-no-formats-error",
+        ]
+        if cookies:
+            cmd += ["--cookies", str(cookies)]
+        elif browser:
+            cmd += ["--cookies-from-browser", browser]
+        cmd.append(video.get("url"))
+        rc = run(cmd)
+        return video, rc, find_vtt_for_video(subs_dir, vid) if rc == 0 else None
+
+    # yt-dlp runs are network-bound, so overlap them; parsing stays serial and in order.
+    results: List[Tuple[Dict[str, str], int, Optional[Path]]] = []
+    if videos:
+        with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(videos))) as pool:
+            futures = [pool.submit(fetch_one, idx, video) for idx, video in enumerate(videos, start=1)]
+            try:
+                results = [future.result() for future in futures]
+            except BaseException:
+                # On an error or Ctrl-C, don't launch yt-dlp for the videos still queued.
+                pool.shutdown(cancel_futures=True)
+                raise
+
+    # The cookie fallback reuses one parsed jar and one keep-alive client for the whole run.
+    jar = load_cookies_from_netscape(cookies) if cookies else {}
+    cookie_client = new_http_client(jar) if jar else None
+    try:
+        for video, rc, vtt in results:
+            vid = video.get("video_id")
+            title = video.get("title") or ""
+            url = video.get("url")
+            transcript: Optional[str] = None
             if vtt:
                 transcript = parse_vtt_to_paragraphs(vtt)
-        if not transcript and cookies:
-            print("  yt-dlp failed or no VTT; trying direct fetch with cookies...")
-            transcript = fetch_transcript_via_cookies(vid, cookies)
-        if not transcript:
-            print("  Could not obtain subtitles; skipping")
-            continue
-        talk_title, speaker = split_title_and_speaker(title)
-        talks.append(
-            {
-                "speaker": speaker or "Unknown Speaker",
-                "title": talk_title or title,
-                "date": "",
-                "source_url": url,
-                "transcript": transcript,
-            }
-        )
+            if not transcript and cookies:
+                print(f"  {vid}: yt-dlp failed or no VTT; trying direct fetch with cookies...")
+                transcript = fetch_transcript_via_cookies(vid, jar, cookie_client)
+            if not transcript:
+                print(f"  {vid}: could not obtain subtitles; skipping")
+                continue
+            talk_title, speaker = split_title_and_speaker(title)
+            talks.append(
+                {
+                    "speaker": speaker or "Unknown Speaker",
+                    "title": talk_title or title,
+                    "date": "",
+                    "source_url": url,
+                    "transcript": transcript,
+                }
+            )
+    finally:
+        if cookie_client is not None:
+            cookie_client.close()
 
     if not talks:
         print("Warning: no subtitles were harvested.")
     payload = {"series": data.get("series") or "YC AI Startup School", "talks": talks}
     out_talks_path.parent.mkdir(parents=True, exist_ok=True)
-    out_talks_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    write_file_atomic(out_talks_path, dump_json(payload))
     try:
         rel = out_talks_path.relative_to(PROJECT_ROOT)
     except ValueError:
@@ -2,16 +2,40 @@
 
 from __future__ import annotations
 
+import json
 import os
 import shutil
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
-__all__ = ["find_yt_dlp"]
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
 
+try:  # Optional accelerator; output is byte-identical to the stdlib path.
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
 
+__all__ = [
+    "JsonListWriter",
+    "dump_json",
+    "find_yt_dlp",
+    "http_client",
+    "new_http_client",
+    "load_json",
+    "write_file",
+    "write_file_atomic",
+]
+
+
+@lru_cache(maxsize=1)
 def find_yt_dlp() -> Optional[Path]:
-    """Locate a yt-dlp binary via env vars, PATH, or common install locations."""
+    """Locate a yt-dlp binary via env vars, PATH, or common install locations.
+
+    The lookup is cached for the life of the process.
+    """
 
     for env_var in ("YTDLP", "YT_DLP"):
         val = os.environ.get(env_var)
@@ -33,3 +57,109 @@ def find_yt_dlp() -> Optional[Path]:
         if cand.exists():
             return cand
     return None
+
+
+def write_file(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` with raw ``os.write`` calls, skipping the buffered IO layer."""
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_file_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to a sibling temp file and rename it over ``path``."""
+
+    tmp = path.with_name(path.name + ".tmp")
+    write_file(tmp, data)
+    os.replace(tmp, path)
+
+
+def load_json(data: Union[bytes, str]) -> Any:
+    """Parse JSON text or UTF-8 bytes, using orjson when installed."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(obj: Any) -> bytes:
+    """Serialize ``obj`` as 2-space indented UTF-8 JSON, using orjson when installed."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _nest_json(data: bytes, depth: int) -> bytes:
+    # Re-indent a top-level ``dump_json`` document for embedding ``depth`` levels deep.
+    return data.replace(b"\n", b"\n" + b"  " * depth)
+
+
+class JsonListWriter:
+    """Stream ``{**head, key: [items...]}`` to ``path`` as items become available.
+
+    The finished file is byte-identical to ``dump_json`` of the whole object. Output goes
+    to a sibling ``.tmp`` file that replaces ``path`` only when the block exits cleanly, so
+    an interrupted run keeps the previous file and leaves its partial output alongside.
+    """
+
+    def __init__(self, path: Path, head: Dict[str, Any], key: str) -> None:
+        self.path = path
+        self._tmp = path.with_name(path.name + ".tmp")
+        self._fh = open(self._tmp, "wb")
+        self._count = 0
+        self._fh.write(b"{")
+        for name, value in head.items():
+            self._fh.write(b"\n  " + dump_json(name) + b": " + _nest_json(dump_json(value), 1) + b",")
+        self._fh.write(b"\n  " + dump_json(key) + b": [")
+
+    def write(self, item: Any) -> None:
+        self._fh.write((b",\n    " if self._count else b"\n    ") + _nest_json(dump_json(item), 2))
+        self._count += 1
+
+    def close(self) -> None:
+        self._fh.write(b"\n  ]\n}" if self._count else b"]\n}")
+        self._fh.close()
+        os.replace(self._tmp, self.path)
+
+    def __enter__(self) -> "JsonListWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._fh.close()
+
+
+def new_http_client(cookies: Optional[Dict[str, str]] = None) -> Optional["httpx.Client"]:
+    """Return a new keep-alive ``httpx.Client``, or ``None`` if httpx is missing.
+
+    HTTP/2 is used when the ``h2`` package is available. Without ``cookies`` the client
+    refuses every ``Set-Cookie``, so it carries no state between requests (like urlopen).
+    With ``cookies`` they are sent on every request, redirects included; close the client
+    when done. httpx is imported here so importing this module stays cheap.
+    """
+
+    try:
+        import httpx
+    except ImportError:  # pragma: no cover - depends on installed extras
+        return None
+    jar: Any = cookies or CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+    try:
+        return httpx.Client(http2=True, timeout=20.0, follow_redirects=True, cookies=jar)
+    except ImportError:
+        return httpx.Client(timeout=20.0, follow_redirects=True, cookies=jar)
+
+
+@lru_cache(maxsize=1)
+def http_client() -> Optional["httpx.Client"]:
+    """Return the process-wide cookie-less client from ``new_http_client``, or ``None``."""
+
+    return new_http_client()
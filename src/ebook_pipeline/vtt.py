@@ -0,0 +1,81 @@
+"""WebVTT subtitle parsing.
+
+Kept free of package imports so ``setup.py`` can optionally compile it with Cython;
+the compiled extension then shadows this file on import.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import List
+
+# Structural lines (cue timings, cue indexes, header/metadata) in a single anchored match.
+STRUCTURE_RE = re.compile(
+    r"\d{2}:\d{2}:\d{2}\.\d{3} --> "
+    r"|\d+$"
+    r"|WEBVTT|NOTE"
+    r"|(?i:Kind|Language|Style|Region):"
+)
+INLINE_TS_RE = re.compile(r"<\d{2}:\d{2}:\d{2}\.\d{3}>")
+TAG_RE = re.compile(r"<[^>]+>")
+NOISE_RE = re.compile(r"\[(music|applause|laughter|inaudible)[^\]]*\]", re.IGNORECASE)
+WS_ANY_RE = re.compile(r"\s+")
+STRUCTURE_INITIALS = "WNKLSRklsr"
+
+
+def parse_vtt_to_paragraphs(path: Path) -> str:
+    text_lines: List[str] = []
+    with path.open("r", encoding="utf-8", errors="replace") as fh:
+        for ln in fh:
+            ln = ln.rstrip("\n")
+            if not ln:
+                text_lines.append("")
+                continue
+            # Plain caption text rarely starts like a structural line, so gate the regex
+            # on the first character.
+            c = ln[0]
+            if (c.isdigit() or c in STRUCTURE_INITIALS) and STRUCTURE_RE.match(ln):
+                continue
+            clean = ln
+            if "<" in clean:
+                if "<c>" in clean or INLINE_TS_RE.search(clean):
+                    continue
+                clean = TAG_RE.sub("", clean)
+            if "[" in clean:
+                clean = NOISE_RE.sub("", clean)
+            trimmed = clean.strip()
+            if text_lines and trimmed and text_lines[-1] == trimmed:
+                continue
+            text_lines.append(trimmed)
+
+    paras: List[str] = []
+    buf: List[str] = []
+    buf_len = 0  # len(" ".join(buf)) + 1, kept incrementally
+    for ln in text_lines:
+        if not ln.strip():
+            continue
+        frag = ln.strip()
+        if buf and frag:
+            last = buf[-1]
+            if last == frag:
+                continue
+            if frag.startswith(last) and len(frag) > len(last) + 2:
+                buf[-1] = frag
+                buf_len += len(frag) - len(last)
+                continue
+            if last.startswith(frag) and len(last) > len(frag) + 2:
+                continue
+        buf.append(frag)
+        buf_len += len(frag) + 1
+        if buf_len > 801:
+            paras.append(" ".join(buf))
+            buf = []
+            buf_len = 0
+    if buf:
+        paras.append(" ".join(buf))
+    paras = [WS_ANY_RE.sub(" ", p).strip() for p in paras if p.strip()]
+    return "\n\n".join(paras) + "\n"
+
+
+__all__ = ["parse_vtt_to_paragraphs"]
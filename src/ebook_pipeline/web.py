@@ -5,7 +5,7 @@ from __future__ import annotations
 import argparse
 from urllib.parse import quote
 
-from flask import Flask, render_template_string, request
+from flask import Flask, render_template, request
 
 from .youtube import fetch_single_transcript
 
@@ -66,7 +66,7 @@ PAGE = """
         </div>
         <div class="actions">
           <a class="download" href="{{ download_href }}" download="{{ video_id }}.txt">Download .txt</a>
-          <span class="pill">{{ transcript.split()|length }} words</span>
+          <span class="pill">{{ word_count }} words</span>
         </div>
         <textarea readonly>{{ transcript }}</textarea>
       </div>
@@ -84,6 +84,8 @@ def _parse_langs(value: str) -> list[str]:
 
 def create_app() -> Flask:
     app = Flask(__name__)
+    # Parse the page once; Flask's environment keeps autoescaping and context processors.
+    page = app.jinja_env.from_string(PAGE)
 
     @app.route("/", methods=["GET", "POST"])
     def index():
@@ -96,6 +98,7 @@ def create_app() -> Flask:
             "speaker": "",
             "date": "",
             "transcript": "",
+            "word_count": 0,
             "video_id": "",
             "download_href": "",
         }
@@ -114,18 +117,19 @@ def create_app() -> Flask:
                 if not result:
                     context["error"] = "未找到可用字幕（可能需要登录或该视频未提供字幕）。"
                 else:
+                    transcript = result.get("transcript") or ""
                     context.update(
                         {
                             "title": result.get("title") or result.get("raw_title") or "Untitled",
                             "speaker": result.get("speaker") or "Unknown Speaker",
                             "date": result.get("date") or "",
-                            "transcript": result.get("transcript") or "",
+                            "transcript": transcript,
+                            "word_count": len(transcript.split()),
                             "video_id": result.get("video_id") or "",
-                            "download_href": "data:text/plain;charset=utf-8,"
-                            + quote((result.get("transcript") or "")),
+                            "download_href": "data:text/plain;charset=utf-8," + quote(transcript),
                         }
                     )
-        return render_template_string(PAGE, **context)
+        return render_template(page, **context)
 
     return app
 
@@ -1,17 +1,36 @@
 # Module with helpers to discover YC AI Startup School videos and transcripts.
+import gzip
+import hashlib
 import html
+import io
 import json
 import re
+import threading
 import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Iterable
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Iterator
 from urllib.parse import quote_plus
 from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 
 from . import PROJECT_ROOT
 from .paths import SeriesPaths
+from .utils import JsonListWriter, dump_json, http_client, load_json, write_file_atomic
+
+try:  # Optional transcript backend; the caption-track scrapers are used without it.
+    from youtube_transcript_api import YouTubeTranscriptApi
+except Exception:  # pragma: no cover - depends on installed extras
+    YouTubeTranscriptApi = None
+
+try:  # Cython build of the brace scanner (see setup.py); the regex scan below is the fallback.
+    from ._native import scan_balanced
+except ImportError:  # pragma: no cover - depends on the build
+    scan_balanced = None
 
 
 UA = (
@@ -20,6 +39,45 @@ UA = (
     "Chrome/124.0 Safari/537.36"
 )
 
+MAX_FETCH_WORKERS = 8
+
+# How long a cached talk entry under ``paths.cache_dir / "yt"`` is reused before refetching.
+CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Marks a talk whose "transcript" is only the video description; these are never cached.
+DESCRIPTION_PLACEHOLDER_PREFIX = "Description (not a full transcript):"
+
+# A JSON string literal (escapes included) or a single brace.
+_JSON_SCAN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}]', re.DOTALL)
+
+# Every spelling of each anchor in one alternation, so a page is scanned once per lookup.
+# ("var ytInitialData = " is covered by its unprefixed form.)
+_INITIAL_DATA_ANCHOR_RE = re.compile(r'ytInitialData = |"ytInitialData"\s*:\s*')
+_PLAYER_RESPONSE_ANCHOR_RE = re.compile(r'ytInitialPlayerResponse = |"ytInitialPlayerResponse"\s*:\s*')
+
+_VID_FULL_RE = re.compile(r"[A-Za-z0-9_-]{11}")
+_VID_QUERY_RE = re.compile(r"[?&]v=([A-Za-z0-9_-]{11})")
+_VID_SHORT_RE = re.compile(r"youtu\.be/([A-Za-z0-9_-]{11})")
+
+_SERIES_SUFFIX_RE = re.compile(r"\s*[|\-]\s*ai startup school.*$", re.IGNORECASE)
+_SERIES_PAREN_RE = re.compile(r"\s*\(ai startup school.*\)$", re.IGNORECASE)
+_BY_RE = re.compile(r"(.+?)\s+by\s+(.+)$", re.IGNORECASE)
+_WITH_RE = re.compile(r"(.+?)\s+with\s+(.+)$", re.IGNORECASE)
+_COLON_RE = re.compile(r"^([^:]+):\s*(.+)$")
+_DASH_RE = re.compile(r"^([^\-|–—]+)[\-|–—]\s*(.+)$")
+
+# YouTube timedtext (srv1) as served: one flat run of <text start=".." dur="..">..</text>.
+# XML whitespace is spelled out (not \s) so only input expat would also accept matches.
+_TIMEDTEXT_NODE_RE = re.compile(r'<text start="([^"<&]*)" dur="([^"<&]*)">([^<]*)</text>')
+_TIMEDTEXT_DOC_RE = re.compile(
+    r'(?:<\?xml version="1\.0"(?: encoding="(?i:utf-8)")?[ \t\n]*\?>)?[ \t\n]*<transcript>[ \t\n]*'
+    r'(?:<text start="[^"<&]*" dur="[^"<&]*">[^<]*</text>[ \t\n]*)*'
+    r'</transcript>[ \t\n]*'
+)
+# Characters the XML parser rejects or normalises (carriage returns).
+_XML_UNSAFE_CHAR_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\r\ufffe\uffff]')
+_XML_ENTITY_CHARS = (("&lt;", "<"), ("&gt;", ">"), ("&quot;", '"'), ("&apos;", "'"), ("&amp;", "&"))
+
 
 def extract_video_id(url_or_id: str) -> Optional[str]:
     """Return an 11-character video id from a YouTube URL or a bare id."""
@@ -27,101 +85,130 @@ def extract_video_id(url_or_id: str) -> Optional[str]:
     candidate = (url_or_id or "").strip()
     if not candidate:
         return None
-    if re.fullmatch(r"[A-Za-z0-9_-]{11}", candidate):
+    if _VID_FULL_RE.fullmatch(candidate):
         return candidate
-    m = re.search(r"[?&]v=([A-Za-z0-9_-]{11})", candidate)
+    m = _VID_QUERY_RE.search(candidate)
     if m:
         return m.group(1)
-    m = re.search(r"youtu\.be/([A-Za-z0-9_-]{11})", candidate)
+    m = _VID_SHORT_RE.search(candidate)
     if m:
         return m.group(1)
     return None
 
 
+def _decompress_body(data: bytes, encoding: Optional[str]) -> bytes:
+    encoding = (encoding or "").strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(data)
+    if encoding == "deflate":
+        # Servers send either zlib-wrapped or raw deflate streams under this name.
+        try:
+            return zlib.decompress(data)
+        except zlib.error:
+            return zlib.decompress(data, -zlib.MAX_WBITS)
+    return data
+
+
+def _decode_body(data: bytes, charset: Optional[str]) -> str:
+    try:
+        return data.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        return data.decode("utf-8", errors="replace")
+
+
 def fetch(url: str, retries: int = 3, sleep: float = 0.5) -> str:
+    headers = {"User-Agent": UA, "Accept-Language": "en-US,en;q=0.9"}
+    # Reuse the pooled keep-alive client when httpx is installed; urllib otherwise.
+    # The shared client keeps no cookies, so requests stay as stateless as urlopen's.
+    client = http_client()
+    errors: Tuple[type, ...] = (URLError, HTTPError)
+    if client is not None:
+        import httpx  # already loaded by http_client()
+
+        errors += (httpx.HTTPError,)
     last_err = None
     for i in range(retries):
         try:
-            req = Request(url, headers={"User-Agent": UA, "Accept-Language": "en-US,en;q=0.9"})
+            if client is not None:
+                resp = client.get(url, headers=headers)
+                resp.raise_for_status()
+                return _decode_body(resp.content, resp.charset_encoding)
+            # urllib doesn't negotiate compression itself (httpx does); pages shrink ~6x gzipped.
+            req = Request(url, headers={**headers, "Accept-Encoding": "gzip, deflate"})
             with urlopen(req, timeout=20) as resp:
-                charset = resp.headers.get_content_charset() or "utf-8"
-                data = resp.read()
-                try:
-                    return data.decode(charset, errors="replace")
-                except LookupError:
-                    return data.decode("utf-8", errors="replace")
-        except (URLError, HTTPError) as e:
+                data = _decompress_body(resp.read(), resp.headers.get("Content-Encoding"))
+                return _decode_body(data, resp.headers.get_content_charset())
+        except errors as e:
             last_err = e
             time.sleep(sleep)
     raise RuntimeError(f"Failed to fetch {url}: {last_err}")
 
 
-def _extract_braced_json(source: str, anchor: str) -> Optional[str]:
-    # Find anchor and extract balanced-brace JSON starting at the first '{' after it.
-    idx = source.find(anchor)
-    if idx == -1:
-        return None
-    brace_start = source.find('{', idx)
+def _extract_braced_json(source: str, pos: int) -> Optional[str]:
+    # Extract balanced-brace JSON starting at the first '{' at or after pos.
+    brace_start = source.find('{', pos)
     if brace_start == -1:
         return None
+    if scan_balanced is not None:
+        end = scan_balanced(source, brace_start)
+        return source[brace_start:end] if end != -1 else None
+    # Hop between braces in C; string literals are consumed whole so braces inside them don't count.
     depth = 0
-    for j in range(brace_start, len(source)):
-        c = source[j]
+    for m in _JSON_SCAN_RE.finditer(source, brace_start):
+        c = m.group()
         if c == '{':
             depth += 1
         elif c == '}':
             depth -= 1
             if depth == 0:
-                return source[brace_start:j+1]
+                return source[brace_start:m.end()]
     return None
 
 
-def get_yt_initial_data(html_text: str) -> Optional[Dict[str, Any]]:
-    # Try various patterns that appear on YouTube pages.
-    patterns = [
-        "ytInitialData = ",
-        "var ytInitialData = ",
-        ">ytInitialData\"\s*:\s*",
-    ]
-    for p in patterns:
-        js = _extract_braced_json(html_text, p)
+def _iter_anchored_json(html_text: str, anchor: Pattern[str]) -> Iterator[Any]:
+    # Yield each JSON value that follows an anchor match, in page order, skipping unparsable ones.
+    for m in anchor.finditer(html_text):
+        js = _extract_braced_json(html_text, m.end())
         if js:
             try:
-                return json.loads(js)
+                yield load_json(js)
             except json.JSONDecodeError:
                 continue
+
+
+def get_yt_initial_data(html_text: str) -> Optional[Dict[str, Any]]:
+    # Try the patterns that appear on YouTube pages.
+    for obj in _iter_anchored_json(html_text, _INITIAL_DATA_ANCHOR_RE):
+        return obj
     return None
 
 
 def get_yt_initial_player_response(html_text: str) -> Optional[Dict[str, Any]]:
-    patterns = [
-        "ytInitialPlayerResponse = ",
-        "var ytInitialPlayerResponse = ",
-        "\"ytInitialPlayerResponse\"\s*:\s*",
-    ]
-    # Try each pattern; if multiple matches exist, scan forward to find one with videoDetails
-    for p in patterns:
-        start = 0
-        while True:
-            idx = html_text.find(p, start)
-            if idx == -1:
-                break
-            js = _extract_braced_json(html_text[idx:], p)
-            if js:
-                try:
-                    obj = json.loads(js)
-                    if isinstance(obj, dict) and ('videoDetails' in obj or 'captions' in obj):
-                        return obj
-                except json.JSONDecodeError:
-                    pass
-            start = idx + len(p)
+    # If multiple matches exist, scan forward to find one with videoDetails
+    for obj in _iter_anchored_json(html_text, _PLAYER_RESPONSE_ANCHOR_RE):
+        if isinstance(obj, dict) and ('videoDetails' in obj or 'captions' in obj):
+            return obj
     return None
 
 
-def fetch_video_meta(video_id: str) -> Dict[str, Any]:
+def _load_watch_page(video_id: str) -> Optional[Dict[str, Any]]:
+    # Callers that need both captions and metadata load this once and pass it along.
     url = f"https://www.youtube.com/watch?v={video_id}&hl=en"
-    html_text = fetch(url)
-    pr = get_yt_initial_player_response(html_text) or {}
+    return get_yt_initial_player_response(fetch(url))
+
+
+def _load_watch_page_quietly(video_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        return _load_watch_page(video_id)
+    except Exception:
+        return None
+
+
+def fetch_video_meta(video_id: str) -> Dict[str, Any]:
+    return _video_meta_from_player_response(_load_watch_page(video_id) or {})
+
+
+def _video_meta_from_player_response(pr: Dict[str, Any]) -> Dict[str, Any]:
     vd = pr.get('videoDetails', {})
     mf = pr.get('microformat', {}).get('playerMicroformatRenderer', {})
     meta = {
@@ -133,27 +220,32 @@ def fetch_video_meta(video_id: str) -> Dict[str, Any]:
     return meta
 
 
-def rfind(obj: Any, key: str) -> Iterable[Any]:
-    # Recursively yield values for given key in nested dict/list.
-    if isinstance(obj, dict):
-        if key in obj:
-            yield obj[key]
-        for v in obj.values():
-            yield from rfind(v, key)
-    elif isinstance(obj, list):
-        for item in obj:
-            yield from rfind(item, key)
+def rfind_all(obj: Any, key: str) -> List[Any]:
+    # Collect values for given key in nested dict/list, in depth-first pre-order.
+    # An explicit stack (children pushed in reverse) avoids a generator frame per node.
+    found: List[Any] = []
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, dict):
+            if key in cur:
+                found.append(cur[key])
+            stack.extend(reversed(cur.values()))
+        elif isinstance(cur, list):
+            stack.extend(reversed(cur))
+    return found
 
 
 def text_from_runs(node: Dict[str, Any]) -> str:
     if not node:
         return ""
-    if "simpleText" in node and isinstance(node["simpleText"], str):
-        return node["simpleText"]
-    runs = node.get("runs") or []
-    return "".join(run.get("text", "") for run in runs if isinstance(run, dict))
+    simple = node.get("simpleText")
+    if isinstance(simple, str):
+        return simple
+    return "".join(run.get("text", "") for run in node.get("runs") or () if isinstance(run, dict))
 
 
+@lru_cache(maxsize=4096)
 def _score_title_for_series(title: str) -> int:
     t = title.lower()
     s = 0
@@ -165,6 +257,22 @@ def _score_title_for_series(title: str) -> int:
     return s
 
 
+def _best_playlist_id(data: Any, renderer_key: str) -> Optional[str]:
+    # Single pass argmax over the renderers; ties keep the first, as the old sort did.
+    best_score, best_id = -1, None
+    for pr in rfind_all(data, renderer_key):
+        if not isinstance(pr, dict):
+            continue
+        plid = pr.get("playlistId")
+        title = text_from_runs(pr.get("title") or {})
+        if not (plid and title):
+            continue
+        score = _score_title_for_series(title)
+        if score > best_score:
+            best_score, best_id = score, plid
+    return best_id
+
+
 def find_playlist_id(query: str = "YC AI Startup School") -> Optional[str]:
     # Strategy 1: YouTube search results
     try:
@@ -172,17 +280,9 @@ def find_playlist_id(query: str = "YC AI Startup School") -> Optional[str]:
         html_text = fetch(url)
         data = get_yt_initial_data(html_text)
         if data:
-            candidates: List[Tuple[str, str]] = []
-            for pr in rfind(data, "playlistRenderer"):
-                if not isinstance(pr, dict):
-                    continue
-                plid = pr.get("playlistId")
-                title = text_from_runs(pr.get("title") or {})
-                if plid and title:
-                    candidates.append((plid, title))
-            if candidates:
-                candidates.sort(key=lambda x: _score_title_for_series(x[1]), reverse=True)
-                return candidates[0][0]
+            best_id = _best_playlist_id(data, "playlistRenderer")
+            if best_id:
+                return best_id
     except Exception:
         pass
 
@@ -192,17 +292,9 @@ def find_playlist_id(query: str = "YC AI Startup School") -> Optional[str]:
         ch_html = fetch(ch_url)
         data = get_yt_initial_data(ch_html)
         if data:
-            candidates: List[Tuple[str, str]] = []
-            for gr in rfind(data, "gridPlaylistRenderer"):
-                if not isinstance(gr, dict):
-                    continue
-                plid = gr.get("playlistId")
-                title = text_from_runs(gr.get("title") or {})
-                if plid and title:
-                    candidates.append((plid, title))
-            if candidates:
-                candidates.sort(key=lambda x: _score_title_for_series(x[1]), reverse=True)
-                return candidates[0][0]
+            best_id = _best_playlist_id(data, "gridPlaylistRenderer")
+            if best_id:
+                return best_id
     except Exception:
         pass
 
@@ -212,17 +304,9 @@ def find_playlist_id(query: str = "YC AI Startup School") -> Optional[str]:
         ch_html = fetch(ch_search)
         data = get_yt_initial_data(ch_html)
         if data:
-            candidates: List[Tuple[str, str]] = []
-            for pr in rfind(data, "playlistRenderer"):
-                if not isinstance(pr, dict):
-                    continue
-                plid = pr.get("playlistId")
-                title = text_from_runs(pr.get("title") or {})
-                if plid and title:
-                    candidates.append((plid, title))
-            if candidates:
-                candidates.sort(key=lambda x: _score_title_for_series(x[1]), reverse=True)
-                return candidates[0][0]
+            best_id = _best_playlist_id(data, "playlistRenderer")
+            if best_id:
+                return best_id
     except Exception:
         pass
 
@@ -237,7 +321,7 @@ def get_playlist_videos(playlist_id: str) -> List[Dict[str, Any]]:
         raise RuntimeError("Could not parse ytInitialData for playlist page")
 
     videos: List[Dict[str, Any]] = []
-    for pvr in rfind(data, "playlistVideoRenderer"):
+    for pvr in rfind_all(data, "playlistVideoRenderer"):
         if not isinstance(pvr, dict):
             continue
         vid = pvr.get("videoId")
@@ -260,14 +344,16 @@ def get_playlist_videos(playlist_id: str) -> List[Dict[str, Any]]:
     return uniq
 
 
+@lru_cache(maxsize=4096)
 def clean_title_for_series(title: str) -> str:
     t = title
     # Remove series suffixes like "| AI Startup School" or "- AI Startup School"
-    t = re.sub(r"\s*[|\-]\s*ai startup school.*$", "", t, flags=re.IGNORECASE)
-    t = re.sub(r"\s*\(ai startup school.*\)$", "", t, flags=re.IGNORECASE)
+    t = _SERIES_SUFFIX_RE.sub("", t)
+    t = _SERIES_PAREN_RE.sub("", t)
     return t.strip()
 
 
+@lru_cache(maxsize=4096)
 def looks_like_person(name: str) -> bool:
     tokens = name.replace("–", "-").replace("—", "-").split()
     if not (1 <= len(tokens) <= 6):
@@ -287,28 +373,28 @@ def split_title_and_speaker(raw_title: str) -> Tuple[str, Optional[str]]:
 
     # Common patterns: "Speaker: Talk", "Talk by Speaker", "Speaker - Talk"
     # 1) A by B
-    m = re.search(r"(.+?)\s+by\s+(.+)$", t, flags=re.IGNORECASE)
+    m = _BY_RE.search(t)
     if m:
         talk, speaker = m.group(1).strip(), m.group(2).strip()
         if looks_like_person(speaker):
             return talk, speaker
 
     # 1.5) A with B
-    m = re.search(r"(.+?)\s+with\s+(.+)$", t, flags=re.IGNORECASE)
+    m = _WITH_RE.search(t)
     if m:
         talk, speaker = m.group(1).strip(), m.group(2).strip()
         if looks_like_person(speaker):
             return talk, speaker
 
     # 2) A: B (if A looks like person)
-    m = re.search(r"^([^:]+):\s*(.+)$", t)
+    m = _COLON_RE.search(t)
     if m:
         left, right = m.group(1).strip(), m.group(2).strip()
         if looks_like_person(left):
             return right, left
 
     # 3) A - B (if A looks like person)
-    m = re.search(r"^([^\-|–—]+)[\-|–—]\s*(.+)$", t)
+    m = _DASH_RE.search(t)
     if m:
         left, right = m.group(1).strip(), m.group(2).strip()
         if looks_like_person(left):
@@ -351,12 +437,10 @@ def fetch_transcript_xml(video_id: str, langs: List[str]) -> Optional[str]:
 
 def fetch_transcript_from_player_response(video_id: str) -> Optional[str]:
     # Load watch page and try to extract caption tracks from player response.
-    url = f"https://www.youtube.com/watch?v={video_id}&hl=en"
-    try:
-        html_text = fetch(url)
-        pr = get_yt_initial_player_response(html_text)
-    except Exception:
-        pr = None
+    return _caption_xml_from_player_response(_load_watch_page_quietly(video_id))
+
+
+def _caption_xml_from_player_response(pr: Optional[Dict[str, Any]]) -> Optional[str]:
     if not pr:
         return None
     try:
@@ -374,8 +458,8 @@ def fetch_transcript_from_player_response(video_id: str) -> Optional[str]:
         return s
     if not tracks:
         return None
-    tracks.sort(key=track_score, reverse=True)
-    base_url = tracks[0].get('baseUrl')
+    # max() keeps the first best-scoring track, as the stable reverse sort did.
+    base_url = max(tracks, key=track_score).get('baseUrl')
     if not base_url:
         return None
     # Ensure we get XML format
@@ -388,55 +472,103 @@ def fetch_transcript_from_player_response(video_id: str) -> Optional[str]:
         return None
 
 
-def xml_to_paragraphs(xml_text: str) -> str:
-    try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError:
-        return ""
-
+def _timedtext_lines_fast(xml_text: str) -> Optional[List[Tuple[float, float, str]]]:
+    # Regex reader for the timedtext layout YouTube serves. Returns None for anything it
+    # can't vouch for (other layouts, other entities, invalid characters) so ET decides.
+    if (
+        not _TIMEDTEXT_DOC_RE.fullmatch(xml_text)
+        or xml_text.count("&") != sum(xml_text.count(ent) for ent, _ in _XML_ENTITY_CHARS)
+        or "]]>" in xml_text
+        or _XML_UNSAFE_CHAR_RE.search(xml_text)
+    ):
+        return None
+    nodes = _TIMEDTEXT_NODE_RE.findall(xml_text)
+    # Decode all nodes at once: undo the XML layer (&amp; last so it can't form new entities),
+    # then html.unescape as the ET path does. NUL can't occur in the document or come out of
+    # html.unescape, so it safely separates the nodes.
+    joined = "\0".join(raw for _, _, raw in nodes)
+    if "&" in joined:
+        for ent, char in _XML_ENTITY_CHARS:
+            joined = joined.replace(ent, char)
+        joined = html.unescape(joined)
+    texts = joined.split("\0")
     lines: List[Tuple[float, float, str]] = []  # (start, end, text)
-    for node in root.findall("text"):
-        start = float(node.attrib.get("start", "0"))
-        dur = float(node.attrib.get("dur", "2"))
-        end = start + dur
-        # Node text may be inside; needs unescape and replace newlines
-        raw = node.text or ""
-        txt = html.unescape(raw).replace("\n", " ").strip()
+    for (start_attr, dur_attr, _), txt in zip(nodes, texts):
+        start = float(start_attr)
+        end = start + float(dur_attr)
+        txt = txt.replace("\n", " ").strip()
         if not txt:
             continue
         lines.append((start, end, txt))
+    return lines
+
+
+def _timedtext_lines_etree(xml_text: str) -> Optional[List[Tuple[float, float, str]]]:
+    # Stream the caption nodes and clear each one once read, so the full tree is never held.
+    lines: List[Tuple[float, float, str]] = []  # (start, end, text)
+    depth = 0
+    try:
+        for event, node in ET.iterparse(io.StringIO(xml_text), events=("start", "end")):
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            # Only direct children of the root, as findall("text") would select.
+            if depth != 1 or node.tag != "text":
+                continue
+            start = float(node.attrib.get("start", "0"))
+            dur = float(node.attrib.get("dur", "2"))
+            end = start + dur
+            # Node text may be inside; needs unescape and replace newlines
+            raw = node.text or ""
+            node.clear()
+            txt = html.unescape(raw).replace("\n", " ").strip()
+            if not txt:
+                continue
+            lines.append((start, end, txt))
+    except ET.ParseError:
+        return None
+    return lines
+
 
+def xml_to_paragraphs(xml_text: str) -> str:
+    lines = _timedtext_lines_fast(xml_text)
+    if lines is None:
+        lines = _timedtext_lines_etree(xml_text)
     if not lines:
         return ""
 
-    # Merge lines into paragraphs based on time gaps
+    # Merge lines into paragraphs based on time gaps.
+    # Timedtext is normally in order already, which makes this stable sort a linear pass.
     lines.sort(key=lambda x: x[0])
     paras: List[str] = []
     buf: List[str] = []
+    buf_len = 0  # len(" ".join(buf)) + 1, kept incrementally
     last_end = lines[0][1]
-    for i, (s, e, txt) in enumerate(lines):
+    for s, e, txt in lines:
         gap = s - last_end
         if gap > 2.5 and buf:
             paras.append(" ".join(buf))
             buf = []
+            buf_len = 0
         buf.append(txt)
+        buf_len += len(txt) + 1
         last_end = e
         # Also break long paragraphs
-        if len(" ".join(buf)) > 800:
+        if buf_len > 801:
             paras.append(" ".join(buf))
             buf = []
+            buf_len = 0
     if buf:
         paras.append(" ".join(buf))
 
     # Final cleanup: collapse spaces
-    paras = [re.sub(r"\s+", " ", p).strip() for p in paras if p.strip()]
+    paras = [" ".join(p.split()) for p in paras if p.strip()]
     return "\n\n".join(paras) + "\n"
 
 
 def fetch_transcript_with_library(video_id: str, langs: List[str]) -> Optional[str]:
-    try:
-        from youtube_transcript_api import YouTubeTranscriptApi
-    except Exception:
+    if YouTubeTranscriptApi is None:
         return None
     transcript = None
     try:
@@ -493,9 +625,9 @@ def fetch_transcript_with_library(video_id: str, langs: List[str]) -> Optional[s
     if not transcript:
         return None
     # transcript is a list of dicts or objects with attrs: text, start, duration
-    lines = []
     last_end = 0.0
     buf: List[str] = []
+    buf_len = 0  # len(' '.join(buf)) + 1, kept incrementally
     paras: List[str] = []
     for item in transcript:
         if isinstance(item, dict):
@@ -513,14 +645,17 @@ def fetch_transcript_with_library(video_id: str, langs: List[str]) -> Optional[s
         if s - last_end > 2.5 and buf:
             paras.append(' '.join(buf))
             buf = []
+            buf_len = 0
         buf.append(txt)
+        buf_len += len(txt) + 1
         last_end = e
-        if len(' '.join(buf)) > 800:
+        if buf_len > 801:
             paras.append(' '.join(buf))
             buf = []
+            buf_len = 0
     if buf:
         paras.append(' '.join(buf))
-    paras = [re.sub(r"\s+", " ", p).strip() for p in paras if p.strip()]
+    paras = [" ".join(p.split()) for p in paras if p.strip()]
     return "\n\n".join(paras) + "\n"
 
 
@@ -529,21 +664,20 @@ def assemble_talk_entry(video: Dict[str, Any], langs: List[str]) -> Optional[Dic
     talk_title, speaker = split_title_and_speaker(raw_title)
     # Prefer robust library if available
     transcript = fetch_transcript_with_library(video["video_id"], langs) or ""
+    pr: Optional[Dict[str, Any]] = None
     if not transcript:
-        # Try via player response caption track
-        xml_text = fetch_transcript_from_player_response(video["video_id"]) or fetch_transcript_xml(video["video_id"], langs)
+        # Try via player response caption track; the same page serves the fallback below.
+        pr = _load_watch_page_quietly(video["video_id"])
+        xml_text = _caption_xml_from_player_response(pr) or fetch_transcript_xml(video["video_id"], langs)
         transcript = xml_to_paragraphs(xml_text) if xml_text else ""
     date = ""
     if not transcript:
         # Fallback: use video description as a summary placeholder
-        try:
-            meta = fetch_video_meta(video["video_id"])  # may raise
-        except Exception:
-            meta = {}
+        meta = _video_meta_from_player_response(pr or {})
         desc = (meta.get('shortDescription') or '').strip()
         date = (meta.get('publishDate') or '').strip()
         if desc:
-            transcript = "Description (not a full transcript):\n\n" + desc + "\n"
+            transcript = DESCRIPTION_PLACEHOLDER_PREFIX + "\n\n" + desc + "\n"
     if not transcript:
         # Skip if no transcript at all
         return None
@@ -564,14 +698,13 @@ def fetch_single_transcript(video_url_or_id: str, langs: List[str]) -> Optional[
         raise ValueError("Invalid YouTube URL or video id.")
 
     transcript = fetch_transcript_with_library(vid, langs) or ""
+    # Metadata always comes from the watch page, so load it once for captions too.
+    pr = _load_watch_page_quietly(vid)
     if not transcript:
-        xml_text = fetch_transcript_from_player_response(vid) or fetch_transcript_xml(vid, langs)
+        xml_text = _caption_xml_from_player_response(pr) or fetch_transcript_xml(vid, langs)
         transcript = xml_to_paragraphs(xml_text) if xml_text else ""
 
-    try:
-        meta = fetch_video_meta(vid)
-    except Exception:
-        meta = {}
+    meta = _video_meta_from_player_response(pr or {})
 
     raw_title = (meta.get("title") or "").strip()
     talk_title, speaker = split_title_and_speaker(raw_title or vid)
@@ -598,6 +731,34 @@ class PlaylistDiscoveryError(RuntimeError):
     """Raised when a playlist cannot be discovered."""
 
 
+def _load_cached_entry(cache_file: Path, ttl: float) -> Optional[Dict[str, Any]]:
+    try:
+        if time.time() - cache_file.stat().st_mtime >= ttl:
+            return None
+        return load_json(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+class _RateLimiter:
+    """Space call starts at least ``interval`` seconds apart across threads."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = max(0.0, interval)
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
 def fetch_and_store(
     paths: SeriesPaths,
     *,
@@ -610,11 +771,18 @@ def fetch_and_store(
     sleep: float = 0.3,
     talks_path: Optional[Path] = None,
     videos_path: Optional[Path] = None,
+    refresh: bool = False,
+    cache_ttl: float = CACHE_TTL_SECONDS,
 ) -> Dict[str, Any]:
     """Fetch playlist videos, pull transcripts, and persist to disk.
 
-    Returns a dictionary with playlist metadata, the exported video list,
-    and the talks collection that was written to ``paths.talks_path``.
+    Talk entries are cached per video and language list under
+    ``paths.cache_dir / "yt"`` and reused for ``cache_ttl`` seconds; pass
+    ``refresh=True`` to refetch them. Description-only placeholders are not cached.
+
+    Returns a dictionary with playlist metadata, the exported video list, and
+    the number of talks written to ``paths.talks_path``. Talks are streamed to
+    disk as they arrive rather than kept in memory.
     """
 
     paths.ensure()
@@ -631,58 +799,87 @@ def fetch_and_store(
     if limit and limit > 0:
         videos = videos[:limit]
 
-    talks: List[Dict[str, Any]] = []
-    exported_list: List[Dict[str, Any]] = []
-    for idx, video in enumerate(videos, start=1):
+    limiter = _RateLimiter(sleep)
+    cache_dir = paths.cache_dir / "yt"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Entries depend on the language preference, so it is part of the cache key.
+    langs_key = hashlib.sha1(",".join(languages).encode("utf-8")).hexdigest()[:10]
+
+    def fetch_one(idx: int, video: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
         vid = video.get("video_id")
-        title = video.get("title")
-        print(f"[{idx}/{len(videos)}] Fetching transcript for {vid} — {title}")
+        cache_file = cache_dir / f"{vid}.{langs_key}.json" if vid else None
+        if cache_file and not refresh:
+            cached = _load_cached_entry(cache_file, cache_ttl)
+            if cached:
+                print(f"[{idx}/{len(videos)}] Using cached transcript for {vid} — {video.get('title')}")
+                return cached, None
+        limiter.wait()
+        print(f"[{idx}/{len(videos)}] Fetching transcript for {vid} — {video.get('title')}")
         try:
             entry = assemble_talk_entry(video, languages)
         except Exception as exc:  # pragma: no cover - defensive fallback
-            print(f"  Error: {exc}")
-            entry = None
-        if entry:
-            talks.append(entry)
-        else:
-            print("  Skipped (no transcript)")
-        exported_list.append(
-            {
-                "video_id": video.get("video_id"),
-                "title": video.get("title"),
-                "url": video.get("url"),
-            }
-        )
-        time.sleep(sleep)
+            return None, exc
+        # A description placeholder usually means the caption fetch failed (throttling or a
+        # bot check), so only real transcripts are cached.
+        if entry and cache_file and not entry["transcript"].startswith(DESCRIPTION_PLACEHOLDER_PREFIX):
+            write_file_atomic(cache_file, dump_json(entry))
+        return entry, None
+
+    # Transcript fetches are network-bound, so overlap them. Results are consumed in
+    # playlist order as they complete, and each talk is streamed to disk as it arrives.
+    target_talks = talks_path or paths.talks_path
+    talk_count = 0
+    exported_list: List[Dict[str, Any]] = []
+    with JsonListWriter(target_talks, {"series": series_title}, "talks") as talks_out:
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_FETCH_WORKERS, len(videos)))) as pool:
+            # Popping each future as it is consumed lets its entry be freed once written.
+            pending = deque(pool.submit(fetch_one, idx, video) for idx, video in enumerate(videos, start=1))
+            try:
+                for video in videos:
+                    entry, error = pending.popleft().result()
+                    vid = video.get("video_id")
+                    if error is not None:
+                        print(f"  {vid}: Error: {error}")
+                    if entry:
+                        talks_out.write(entry)
+                        talk_count += 1
+                    else:
+                        print(f"  {vid}: Skipped (no transcript)")
+                    exported_list.append(
+                        {
+                            "video_id": video.get("video_id"),
+                            "title": video.get("title"),
+                            "url": video.get("url"),
+                        }
+                    )
+            except BaseException:
+                # On an error or Ctrl-C, stop instead of fetching the rest of the playlist.
+                pool.shutdown(cancel_futures=True)
+                raise
 
     target_videos = videos_path or paths.videos_path
     if export_videos:
         payload = {"playlist_id": resolved_playlist, "videos": exported_list}
-        with open(target_videos, "w", encoding="utf-8") as fh:
-            json.dump(payload, fh, ensure_ascii=False, indent=2)
+        write_file_atomic(target_videos, dump_json(payload))
         try:
             rel_video = target_videos.relative_to(PROJECT_ROOT)
         except ValueError:
             rel_video = target_videos
         print(f"Exported video list to {rel_video}")
 
-    target_talks = talks_path or paths.talks_path
-    talks_payload = {"series": series_title, "talks": talks}
-    with open(target_talks, "w", encoding="utf-8") as fh:
-        json.dump(talks_payload, fh, ensure_ascii=False, indent=2)
     try:
         rel_talks = target_talks.relative_to(PROJECT_ROOT)
     except ValueError:
         rel_talks = target_talks
-    print(f"Wrote talks to {rel_talks} ({len(talks)} entries)")
+    print(f"Wrote talks to {rel_talks} ({talk_count} entries)")
 
-    if not talks:
+    if not talk_count:
         print("Warning: no talks with transcripts were stored.")
 
     return {
         "playlist_id": resolved_playlist,
         "videos": exported_list,
-        "talks": talks,
+        "talk_count": talk_count,
     }
 
 